@@ -0,0 +1,16 @@
+"""Modular helpers behind MetaAnalysis.ipynb."""
+
+from .analysis import analyze_from_csv, analyze_repo, parse_slug
+from .gitmeta import analyze_repo_local
+from .loc import count_lines, count_lines_with_wc
+from .log import recent_log
+
+__all__ = [
+    "analyze_from_csv",
+    "analyze_repo",
+    "analyze_repo_local",
+    "count_lines",
+    "count_lines_with_wc",
+    "parse_slug",
+    "recent_log",
+]
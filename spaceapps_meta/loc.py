@@ -0,0 +1,160 @@
+"""Line-of-code counting for cloned repositories.
+
+Python port of the ``wc -l`` loop in ``scripts/collect_repo_metadata.sh``:
+tracked files are listed with ``git ls-files -z``, binary-ish extensions are
+skipped, and the remaining files are counted with ``wc``.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+
+from .log import log
+
+# Environment for every child process: git skips re-parsing the system
+# config on each of the many invocations per batch and never blocks on a
+# credential prompt for dead/private repo URLs. Built once at import;
+# behavioral tweaks go through per-invocation -c flags instead of mutating
+# any global git config.
+GIT_ENV = {**os.environ,
+           "GIT_CONFIG_NOSYSTEM": "1",
+           "GIT_TERMINAL_PROMPT": "0"}
+
+# Paths per wc invocation; keeps the command line well under ARG_MAX.
+_WC_CHUNK = 4000
+
+# Extensions skipped by collect_repo_metadata.sh, already lower-case so the
+# per-path check is one .lower() plus one frozenset probe. Built once at
+# import instead of per ls-files pass.
+BIN_EXT = frozenset({
+    b"jpg", b"jpeg", b"png", b"gif", b"pdf", b"zip", b"exe", b"mp4",
+    b"mov", b"avi", b"mp3", b"ogg", b"ttf", b"otf", b"svg",
+})
+
+# has_cloc() probe result, shared by every repo in a batch.
+_HAS_CLOC = None
+
+
+def has_cloc():
+    """Whether ``cloc`` is on PATH; probed once per process, not per repo."""
+    global _HAS_CLOC
+    if _HAS_CLOC is None:
+        _HAS_CLOC = shutil.which("cloc") is not None
+    return _HAS_CLOC
+
+
+def _run(cmd, cwd=None, text=True):
+    """Run a command, logging failures; shared by every helper module.
+
+    Output is captured as bytes and, for text callers, decoded in one shot:
+    ``text=True`` on subprocess.run routes every read through an
+    incremental decoder plus universal-newline translation, which is pure
+    overhead for the output wc/cloc/git produce here.
+    """
+    proc = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, env=GIT_ENV)
+    if text:
+        proc.stdout = proc.stdout.decode("utf-8", "replace")
+        proc.stderr = proc.stderr.decode("utf-8", "replace")
+    if proc.returncode != 0:
+        log(f"⚠️ {' '.join(cmd)} exited {proc.returncode}")
+    return proc
+
+
+def _tracked_text_files(repo_dir):
+    """Tracked paths minus the binary extensions the shell script skips.
+
+    ``git ls-files -z`` is consumed as raw bytes: the extension filter runs
+    on the bytes themselves and only surviving paths pay for
+    ``os.fsdecode``, which also round-trips non-UTF-8 filenames instead of
+    mangling them.
+    """
+    proc = _run(["git", "ls-files", "-z"], cwd=repo_dir, text=False)
+    if proc.returncode != 0:
+        return []
+    paths = []
+    for rel in proc.stdout.split(b"\0"):
+        if not rel:
+            continue
+        dot = rel.rfind(b".")
+        if dot >= 0 and rel[dot + 1:].lower() in BIN_EXT:
+            continue
+        paths.append(os.fsdecode(rel))
+    return paths
+
+
+def _count_one_by_one(paths, repo_dir):
+    """Per-file ``wc -l`` fallback for chunks where the batched call failed."""
+    total = 0
+    for rel in paths:
+        proc = _run(["wc", "-l", "--", rel], cwd=repo_dir)
+        if proc.returncode == 0:
+            total += int(proc.stdout.split()[0])
+    return total
+
+
+def count_lines_with_cloc(repo_dir, processes=None):
+    """Code line count from ``cloc --vcs=git``, or ``None`` if cloc fails.
+
+    ``processes`` is forwarded as ``--processes=N`` so cloc spreads its
+    per-file scanning over cores; it defaults to the machine's CPU count.
+    cloc builds without Parallel::ForkManager reject the flag outright, so
+    a failed parallel invocation is retried once serially before giving up.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    proc = _run(["cloc", "--vcs=git", f"--processes={processes}",
+                 "--json", "--quiet", "."], cwd=repo_dir)
+    if proc.returncode != 0:
+        proc = _run(["cloc", "--vcs=git", "--json", "--quiet", "."],
+                    cwd=repo_dir)
+    if proc.returncode != 0:
+        return None
+    if not proc.stdout.strip():
+        # Exit 0 with no output: an empty tree, a genuine zero.
+        return 0
+    try:
+        return json.loads(proc.stdout)["SUM"]["code"]
+    except (ValueError, KeyError):
+        log(f"⚠️ cloc produced unparsable output for {repo_dir}")
+        return None
+
+
+def count_lines(repo_dir, processes=None):
+    """Lines of code for ``repo_dir``: cloc when available, wc otherwise.
+
+    When cloc is installed its answer is authoritative: a hard cloc
+    failure is logged and surfaced as ``None`` (NaN in the DataFrame)
+    rather than re-counted with wc, whose raw newline totals are not
+    comparable to cloc's comment-aware numbers and would skew the column
+    within one batch — and rather than a 0 indistinguishable from a
+    genuinely empty repo.
+    """
+    if has_cloc():
+        return count_lines_with_cloc(repo_dir, processes=processes)
+    return count_lines_with_wc(repo_dir)
+
+
+def count_lines_with_wc(repo_dir):
+    """Total line count across tracked text files in ``repo_dir``.
+
+    Paths are passed to ``wc -l`` in chunks of ``_WC_CHUNK`` so a whole repo
+    costs a handful of subprocess forks instead of one per file.
+    """
+    paths = _tracked_text_files(repo_dir)
+    total = 0
+    for start in range(0, len(paths), _WC_CHUNK):
+        chunk = paths[start:start + _WC_CHUNK]
+        proc = _run(["wc", "-l", "--", *chunk], cwd=repo_dir)
+        if proc.returncode != 0:
+            # wc exits non-zero if any path is unreadable; retry one by one.
+            total += _count_one_by_one(chunk, repo_dir)
+            continue
+        lines = proc.stdout.splitlines()
+        if len(chunk) > 1:
+            # With several args the last line is "NNN total".
+            total += int(lines[-1].split()[0])
+        elif lines:
+            total += int(lines[0].split()[0])
+    return total
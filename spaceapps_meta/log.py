@@ -0,0 +1,62 @@
+"""In-memory logging shared by the spaceapps_meta helpers.
+
+Per-subprocess ``print`` calls serialized every worker on the interpreter's
+stdout lock and interleaved garbage under concurrency. Messages now go to a
+bounded, thread-safe ring buffer; set ``SPACEAPPS_META_VERBOSE=1`` to echo
+them to stdout as well. ``recent_log()`` returns the tail for inspection
+after a batch (e.g. from the notebook).
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+VERBOSE = os.environ.get("SPACEAPPS_META_VERBOSE", "") not in ("", "0")
+
+_BUFFER = deque(maxlen=256)
+_LOCK = threading.Lock()
+
+
+def log(msg):
+    """Timestamp ``msg`` into the ring buffer; echo to stdout when verbose.
+
+    The clock is read once per message with ``time.strftime``, which is a
+    few times cheaper than building and formatting a ``datetime``; callers
+    pass bare messages instead of each formatting their own timestamp.
+    """
+    entry = f"[{time.strftime('%H:%M:%S')}] {msg}"
+    with _LOCK:
+        _BUFFER.append(entry)
+    if VERBOSE:
+        print(entry)
+
+
+def drain_log():
+    """Remove and return everything buffered in this process.
+
+    Pool workers have their own copy of the ring buffer, so anything they
+    log would die with the worker; draining after each task lets the
+    worker ship its messages back with the result for the parent to
+    ``replay``.
+    """
+    with _LOCK:
+        messages = list(_BUFFER)
+        _BUFFER.clear()
+    return messages
+
+
+def replay(entries):
+    """Re-buffer already-timestamped entries relayed from a worker."""
+    with _LOCK:
+        _BUFFER.extend(entries)
+    if VERBOSE:
+        for entry in entries:
+            print(entry)
+
+
+def recent_log(n=None):
+    """The last ``n`` buffered messages (all of them by default)."""
+    with _LOCK:
+        messages = list(_BUFFER)
+    return messages if n is None else messages[-n:]